@@ -129,9 +129,13 @@ func (re *RulesEngine) GenerateDamageDistribution(ctx *CombatContext, numSimulat
 		return nil, err
 	}
 
-	// Run simulations
+	// Run simulations. Damage values are small non-negative ints, so tally
+	// them in a flat slice (grown on demand) instead of a hash map, and track
+	// min/max in the same pass
 	simRng := rand.New(rand.NewSource(12345)) // Use fixed seed for reproducibility
-	damageCounts := make(map[int32]int)
+	var damageCounts []int
+	var minDamage int32 = math.MaxInt32
+	var maxDamage int32 = 0
 	totalDamage := float64(0)
 
 	for range numSimulations {
@@ -139,17 +143,11 @@ func (re *RulesEngine) GenerateDamageDistribution(ctx *CombatContext, numSimulat
 		if err != nil {
 			return nil, err
 		}
+		if int(damage) >= len(damageCounts) {
+			damageCounts = append(damageCounts, make([]int, int(damage)-len(damageCounts)+1)...)
+		}
 		damageCounts[damage]++
 		totalDamage += float64(damage)
-	}
-
-	// Calculate expected damage
-	expectedDamage := totalDamage / float64(numSimulations)
-
-	// Calculate min and max damage observed
-	var minDamage int32 = math.MaxInt32
-	var maxDamage int32 = 0
-	for damage := range damageCounts {
 		if damage < minDamage {
 			minDamage = damage
 		}
@@ -158,6 +156,9 @@ func (re *RulesEngine) GenerateDamageDistribution(ctx *CombatContext, numSimulat
 		}
 	}
 
+	// Calculate expected damage
+	expectedDamage := totalDamage / float64(numSimulations)
+
 	// Build damage ranges
 	var ranges []*v1.DamageRange
 	for damage := minDamage; damage <= maxDamage; damage++ {
@@ -320,24 +321,22 @@ func (re *RulesEngine) GenerateFixDistribution(ctx *FixContext, numSimulations i
 		numSimulations = 10000 // Default number of simulations
 	}
 
-	// Run simulations
+	// Run simulations. Healing values are small non-negative ints, so tally
+	// them in a flat slice (grown on demand) instead of a hash map, and track
+	// min/max in the same pass
 	simRng := rand.New(rand.NewSource(12345)) // Use fixed seed for reproducibility
-	healingCounts := make(map[int32]int)
+	var healingCounts []int
+	var minHealing int32 = math.MaxInt32
+	var maxHealing int32 = 0
 	totalHealing := float64(0)
 
 	for range numSimulations {
 		healing := re.SimulateFixHealing(ctx, simRng)
+		if int(healing) >= len(healingCounts) {
+			healingCounts = append(healingCounts, make([]int, int(healing)-len(healingCounts)+1)...)
+		}
 		healingCounts[healing]++
 		totalHealing += float64(healing)
-	}
-
-	// Calculate expected healing
-	expectedHealing := totalHealing / float64(numSimulations)
-
-	// Calculate min and max healing observed
-	var minHealing int32 = math.MaxInt32
-	var maxHealing int32 = 0
-	for healing := range healingCounts {
 		if healing < minHealing {
 			minHealing = healing
 		}
@@ -346,6 +345,9 @@ func (re *RulesEngine) GenerateFixDistribution(ctx *FixContext, numSimulations i
 		}
 	}
 
+	// Calculate expected healing
+	expectedHealing := totalHealing / float64(numSimulations)
+
 	// Build healing ranges (reusing DamageDistribution/DamageRange structs)
 	var ranges []*v1.DamageRange
 	for healing := minHealing; healing <= maxHealing; healing++ {
@@ -111,7 +111,8 @@ func CubeDistance(coord1, coord2 AxialCoord) int {
 
 // Range returns all cube coordinates within the specified radius
 func (c AxialCoord) Range(radius int) []AxialCoord {
-	var results []AxialCoord
+	// A hex of radius r contains exactly 3r(r+1)+1 cells - allocate once
+	results := make([]AxialCoord, 0, 3*radius*(radius+1)+1)
 	for q := -radius; q <= radius; q++ {
 		r1 := max(-radius, -q-radius)
 		r2 := min(radius, -q+radius)
@@ -130,7 +131,8 @@ func (c AxialCoord) Ring(radius int) []AxialCoord {
 		return []AxialCoord{c}
 	}
 
-	var results []AxialCoord
+	// A ring of radius r contains exactly 6r cells - allocate once
+	results := make([]AxialCoord, 0, 6*radius)
 	// Start at one direction and walk around the ring
 	coord := c
 
@@ -178,44 +180,28 @@ func GetDirection(from, to AxialCoord) NeighborDirection {
 	return NeighborDirection(-1)
 }
 
+// Direction display tables, indexed by NeighborDirection
+// Order must match the NeighborDirection enum (same as AxialCoordNeighbors)
+var (
+	directionArrows    = [6]string{"←", "↖", "↗", "→", "↘", "↙"}
+	directionCodes     = [6]string{"L", "LU", "RU", "R", "RD", "LD"}
+	directionLongNames = [6]string{"Left", "Top-Left", "Top-Right", "Right", "Bottom-Right", "Bottom-Left"}
+)
+
 // DirectionToString converts a NeighborDirection to an ASCII arrow
 func DirectionToString(dir NeighborDirection) string {
-	switch dir {
-	case LEFT:
-		return "←"
-	case TOP_LEFT:
-		return "↖"
-	case TOP_RIGHT:
-		return "↗"
-	case RIGHT:
-		return "→"
-	case BOTTOM_RIGHT:
-		return "↘"
-	case BOTTOM_LEFT:
-		return "↙"
-	default:
+	if dir < 0 || int(dir) >= len(directionArrows) {
 		return "?"
 	}
+	return directionArrows[dir]
 }
 
 // DirectionToCode converts a NeighborDirection to a short code (L, LU, etc)
 func DirectionToCode(dir NeighborDirection) string {
-	switch dir {
-	case LEFT:
-		return "L"
-	case TOP_LEFT:
-		return "LU"
-	case TOP_RIGHT:
-		return "RU"
-	case RIGHT:
-		return "R"
-	case BOTTOM_RIGHT:
-		return "RD"
-	case BOTTOM_LEFT:
-		return "LD"
-	default:
+	if dir < 0 || int(dir) >= len(directionCodes) {
 		return "?"
 	}
+	return directionCodes[dir]
 }
 
 // ParseDirection parses a direction string (L, R, UL, UR, DL, DR, etc.) to NeighborDirection
@@ -247,22 +233,10 @@ func ParseDirection(input string) (NeighborDirection, error) {
 
 // DirectionToLongString converts a NeighborDirection to a descriptive string
 func DirectionToLongString(dir NeighborDirection) string {
-	switch dir {
-	case LEFT:
-		return "Left"
-	case TOP_LEFT:
-		return "Top-Left"
-	case TOP_RIGHT:
-		return "Top-Right"
-	case RIGHT:
-		return "Right"
-	case BOTTOM_RIGHT:
-		return "Bottom-Right"
-	case BOTTOM_LEFT:
-		return "Bottom-Left"
-	default:
+	if dir < 0 || int(dir) >= len(directionLongNames) {
 		return "Unknown"
 	}
+	return directionLongNames[dir]
 }
 
 // =============================================================================
@@ -690,11 +690,12 @@ func (w *World) Clone() *World {
 		return nil
 	}
 
-	// Create new WorldData with cloned maps
+	// Create new WorldData with cloned maps, sized to match the source so the
+	// copy loops below never trigger rehash/regrow
 	clonedData := &v1.WorldData{
-		TilesMap:  make(map[string]*v1.Tile),
-		UnitsMap:  make(map[string]*v1.Unit),
-		Crossings: make(map[string]*v1.Crossing),
+		TilesMap:  make(map[string]*v1.Tile, len(w.data.TilesMap)),
+		UnitsMap:  make(map[string]*v1.Unit, len(w.data.UnitsMap)),
+		Crossings: make(map[string]*v1.Crossing, len(w.data.Crossings)),
 	}
 
 	// Clone tiles
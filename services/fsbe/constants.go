@@ -1,7 +1,6 @@
 package fsbe
 
 import (
-	"math"
 	"math/rand"
 	"path/filepath"
 	"strconv"
@@ -18,7 +17,7 @@ func DevDataPath(path string) string {
 
 // shortRandSuffix generates a 4-character random suffix for ID suggestions
 func shortRandSuffix() string {
-	max_id := int64(math.Pow(36, 4))
+	const max_id = int64(36) * 36 * 36 * 36
 	randval := rand.Int63() % max_id
 	return strconv.FormatInt(randval, 36)
 }
@@ -5,7 +5,6 @@ package gaebe
 
 import (
 	"context"
-	"math"
 	"math/rand"
 	"strconv"
 	"strings"
@@ -23,7 +22,7 @@ type GenId struct {
 }
 
 func randid() string {
-	max_id := int64(math.Pow(36, 8))
+	const max_id = int64(36) * 36 * 36 * 36 * 36 * 36 * 36 * 36
 	randval := rand.Int63() % max_id
 	return strconv.FormatInt(randval, 36)
 }
@@ -3,7 +3,6 @@ package gormbe
 import (
 	"errors"
 	"log"
-	"math"
 	"math/rand"
 	"strconv"
 	"strings"
@@ -21,7 +20,7 @@ type GenId struct {
 }
 
 func randid() string {
-	max_id := int64(math.Pow(36, 8))
+	const max_id = int64(36) * 36 * 36 * 36 * 36 * 36 * 36 * 36
 	randval := rand.Int63() % max_id
 	return strconv.FormatInt(randval, 36)
 }
@@ -32,7 +31,7 @@ func GetID(storage *gorm.DB, cls string, id string) *GenId {
 
 // shortRandSuffix generates a 4-character random suffix for ID suggestions
 func shortRandSuffix() string {
-	max_id := int64(math.Pow(36, 4))
+	const max_id = int64(36) * 36 * 36 * 36
 	randval := rand.Int63() % max_id
 	return strconv.FormatInt(randval, 36)
 }
@@ -1,5 +1,7 @@
 package services
 
+import "math"
+
 // max returns the maximum of two integers
 func Max(a, b int) int {
 	if a > b {
@@ -15,25 +17,12 @@ func abs(x int) int {
 	return x
 }
 
-// Simple math helpers (since we can't import math in WASM easily)
 func cos(angle float64) float64 {
-	// Simple cosine approximation using Taylor series
-	// cos(x) ≈ 1 - x²/2! + x⁴/4! - x⁶/6!
-	x := angle
-	for x > 3.14159*2 {
-		x -= 3.14159 * 2
-	}
-	for x < 0 {
-		x += 3.14159 * 2
-	}
-
-	x2 := x * x
-	return 1 - x2/2 + x2*x2/24 - x2*x2*x2/720
+	return math.Cos(angle)
 }
 
 func sin(angle float64) float64 {
-	// sin(x) = cos(x - π/2)
-	return cos(angle - 3.14159/2)
+	return math.Sin(angle)
 }
 
 // contains checks if slice contains string
@@ -53,13 +42,3 @@ func minFloat(a, b float64) float64 {
 	}
 	return b
 }
-
-func approximateCos(angle float64) float64 {
-	// Simple approximation - in a real implementation, use math.Cos
-	return 1.0 - angle*angle/2.0 + angle*angle*angle*angle/24.0
-}
-
-func approximateSin(angle float64) float64 {
-	// Simple approximation - in a real implementation, use math.Sin
-	return angle - angle*angle*angle/6.0 + angle*angle*angle*angle*angle/120.0
-}
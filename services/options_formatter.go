@@ -34,7 +34,8 @@ func (f *OptionFormatter) FormatMoveUnitAction(moveOpt *v1.MoveUnitAction, allPa
 	targetCoord := CoordFromInt32(moveOpt.To.Q, moveOpt.To.R)
 
 	// Basic format: "move to (q,r) (cost: X)"
-	result := fmt.Sprintf("move to %s (cost: %f)",
+	var result strings.Builder
+	fmt.Fprintf(&result, "move to %s (cost: %f)",
 		targetCoord.String(), moveOpt.MovementCost)
 
 	// Add path visualization if available and requested
@@ -42,16 +43,15 @@ func (f *OptionFormatter) FormatMoveUnitAction(moveOpt *v1.MoveUnitAction, allPa
 		path, err := ReconstructPath(allPaths, moveOpt.To.Q, moveOpt.To.R)
 		if err == nil && path != nil {
 			if f.DetailedPaths {
-				pathStr := FormatPathDetailed(path, "   ")
-				result += "\n" + pathStr
+				result.WriteString("\n")
+				result.WriteString(FormatPathDetailed(path, "   "))
 			} else {
-				pathStr := FormatPathCompact(path)
-				result += fmt.Sprintf("\n   Path: %s", pathStr)
+				fmt.Fprintf(&result, "\n   Path: %s", FormatPathCompact(path))
 			}
 		}
 	}
 
-	return result
+	return result.String()
 }
 
 // FormatAttackUnitAction formats an attack option with damage estimate
@@ -59,17 +59,18 @@ func (f *OptionFormatter) FormatAttackUnitAction(attackOpt *v1.AttackUnitAction)
 	targetCoord := CoordFromInt32(attackOpt.Defender.Q, attackOpt.Defender.R)
 
 	// Include target unit type and damage estimate
-	result := fmt.Sprintf("attack %s", targetCoord.String())
+	var result strings.Builder
+	fmt.Fprintf(&result, "attack %s", targetCoord.String())
 
 	if attackOpt.TargetUnitType > 0 {
-		result += fmt.Sprintf(" (type %d", attackOpt.TargetUnitType)
+		fmt.Fprintf(&result, " (type %d", attackOpt.TargetUnitType)
 		if attackOpt.DamageEstimate > 0 {
-			result += fmt.Sprintf(", damage est: %d", attackOpt.DamageEstimate)
+			fmt.Fprintf(&result, ", damage est: %d", attackOpt.DamageEstimate)
 		}
-		result += ")"
+		result.WriteString(")")
 	}
 
-	return result
+	return result.String()
 }
 
 // FormatBuildUnitAction formats a build option
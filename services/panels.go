@@ -3,6 +3,7 @@ package services
 import (
 	"context"
 	"fmt"
+	"strings"
 
 	v1 "github.com/turnforge/lilbattle/gen/go/lilbattle/v1/models"
 	"github.com/turnforge/lilbattle/lib"
@@ -328,14 +329,7 @@ func (b *BaseGameStatePanel) buildIncomeBreakdown(baseCounts map[int32]int32, in
 		return ""
 	}
 
-	result := ""
-	for i, part := range parts {
-		if i > 0 {
-			result += " + "
-		}
-		result += part
-	}
-	return result
+	return strings.Join(parts, " + ")
 }
 
 // IsViewerLoggedIn returns true if the viewer is logged in
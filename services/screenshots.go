@@ -7,6 +7,8 @@ import (
 	"context"
 	"fmt"
 	"log"
+	"runtime"
+	"sync"
 	"time"
 
 	"github.com/panyam/gocurrent"
@@ -34,12 +36,23 @@ type ScreenShotIndexer struct {
 
 	ClientMgr *ClientMgr
 
+	// Renderers cached per theme - they hold decoded-asset caches, so reusing
+	// them across items avoids re-reading every tile/unit asset from disk for
+	// each screenshot
+	renderersMutex sync.Mutex
+	renderers      map[string]themes.WorldRenderer
+
+	// Versions already rendered, keyed by kind/id - items re-sent with an
+	// unchanged version skip the full render+upload pass
+	renderedMutex    sync.Mutex
+	renderedVersions map[string]int64
+
 	// Callback invoked after all screenshots for an item are complete
 	OnComplete ScreenshotCompletionCallback
 }
 
 func NewScreenShotIndexer(clientMgr *ClientMgr) *ScreenShotIndexer {
-	s := ScreenShotIndexer{ClientMgr: clientMgr}
+	s := ScreenShotIndexer{ClientMgr: clientMgr, renderers: map[string]themes.WorldRenderer{}, renderedVersions: map[string]int64{}}
 	s.reducer = gocurrent.NewReducer2(
 		gocurrent.WithFlushPeriod2[ScreenShotItem, map[string]ScreenShotItem](5 * time.Second),
 	)
@@ -78,24 +91,75 @@ func (s *ScreenShotIndexer) start() {
 	}
 }
 
-// TODO - Put this into a worker pool later and/or with rate limiting
+// Items in a batch are independent of each other, so render them on a bounded
+// worker pool (one worker per core) instead of serially.
+// TODO - add rate limiting
 func (s *ScreenShotIndexer) startBatchProcessing(batch map[string]ScreenShotItem) {
+	var wg sync.WaitGroup
+	var resultsMutex sync.Mutex
 	results := []ScreenShotItem{}
+	sem := make(chan struct{}, runtime.NumCPU())
 	for _, item := range batch {
-		log.Printf("Creating screenshots for %s: %s", item.Kind, item.Id)
-
-		// Render all themes for this item
-		for _, themeName := range []string{"default", "modern", "fantasy"} {
-			err := s.renderScreenshot(themeName, &item)
-			if err != nil {
-				log.Printf("Failed to render %s screenshot for %s/%s: %v", themeName, item.Kind, item.Id, err)
-				item.ThemeErrors[themeName] = err
-				break // Stop processing other themes if one fails
+		wg.Add(1)
+		sem <- struct{}{}
+		go func(item ScreenShotItem) {
+			defer wg.Done()
+			defer func() { <-sem }()
+
+			// Skip items whose screenshots for this version already exist
+			key := item.Kind + "/" + item.Id
+			s.renderedMutex.Lock()
+			last, seen := s.renderedVersions[key]
+			s.renderedMutex.Unlock()
+			if seen && last == item.Version {
+				return
 			}
-		}
 
-		results = append(results, item)
+			log.Printf("Creating screenshots for %s: %s", item.Kind, item.Id)
+
+			// Render all themes for this item. Uploads are network-bound, so
+			// they run in the background while the next theme renders; both
+			// result maps are guarded since uploads complete out of order
+			var uploadWg sync.WaitGroup
+			var itemMutex sync.Mutex
+			for _, themeName := range []string{"default", "modern", "fantasy"} {
+				imageBytes, contentType, err := s.renderTheme(themeName, &item)
+				if err != nil {
+					log.Printf("Failed to render %s screenshot for %s/%s: %v", themeName, item.Kind, item.Id, err)
+					// Earlier themes' uploads may still be writing these maps
+					itemMutex.Lock()
+					item.ThemeErrors[themeName] = err
+					itemMutex.Unlock()
+					break // Stop processing other themes if one fails
+				}
+				uploadWg.Add(1)
+				go func(themeName string, imageBytes []byte, contentType string) {
+					defer uploadWg.Done()
+					file, err := s.uploadScreenshot(item.Kind, item.Id, themeName, imageBytes, contentType)
+					itemMutex.Lock()
+					defer itemMutex.Unlock()
+					if err != nil {
+						item.ThemeErrors[themeName] = err
+					} else {
+						item.ThemeFiles[themeName] = file
+					}
+				}(themeName, imageBytes, contentType)
+			}
+			uploadWg.Wait()
+
+			// Only remember fully successful renders so failures get retried
+			if len(item.ThemeErrors) == 0 {
+				s.renderedMutex.Lock()
+				s.renderedVersions[key] = item.Version
+				s.renderedMutex.Unlock()
+			}
+
+			resultsMutex.Lock()
+			results = append(results, item)
+			resultsMutex.Unlock()
+		}(item)
 	}
+	wg.Wait()
 
 	// Notify completion with all results
 	if s.OnComplete != nil {
@@ -109,29 +173,44 @@ func (s *ScreenShotIndexer) Send(kind string, id string, version int64, worldDat
 	s.reducer.InputChan() <- ScreenShotItem{kind, id, version, worldData, make(map[string]error), make(map[string]*v1.File)}
 }
 
-func (s *ScreenShotIndexer) renderScreenshot(themeName string, item *ScreenShotItem) error {
-	// Create theme
+// getRenderer returns the cached renderer for a theme, creating it on first use
+func (s *ScreenShotIndexer) getRenderer(themeName string) (themes.WorldRenderer, error) {
+	s.renderersMutex.Lock()
+	defer s.renderersMutex.Unlock()
+	if renderer, ok := s.renderers[themeName]; ok {
+		return renderer, nil
+	}
+
 	re := lib.DefaultRulesEngine()
 	theme, err := themes.CreateTheme(themeName, re.GetCityTerrains())
 	if err != nil {
-		log.Printf("Failed to create theme %s: %v", themeName, err)
-		return err
+		return nil, err
 	}
-
-	// Create renderer for this theme
 	renderer, err := themes.CreateWorldRenderer(theme)
+	if err != nil {
+		return nil, err
+	}
+	s.renderers[themeName] = renderer
+	return renderer, nil
+}
+
+func (s *ScreenShotIndexer) renderTheme(themeName string, item *ScreenShotItem) ([]byte, string, error) {
+	renderer, err := s.getRenderer(themeName)
 	if err != nil {
 		log.Printf("Failed to create renderer for theme %s: %v", themeName, err)
-		return err
+		return nil, "", err
 	}
 
 	// Render the image
 	imageBytes, contentType, err := renderer.Render(item.WorldData.TilesMap, item.WorldData.UnitsMap, nil)
 	if err != nil {
 		log.Printf("Failed to render screenshot: %v", err)
-		return err
+		return nil, "", err
 	}
+	return imageBytes, contentType, nil
+}
 
+func (s *ScreenShotIndexer) uploadScreenshot(kind, id, themeName string, imageBytes []byte, contentType string) (*v1.File, error) {
 	// Determine file extension from content type
 	extension := "png"
 	if contentType == "image/svg+xml" {
@@ -139,7 +218,7 @@ func (s *ScreenShotIndexer) renderScreenshot(themeName string, item *ScreenShotI
 	}
 
 	// Create path: screenshots/{kind}/{id}/{theme}.{ext}
-	filePath := fmt.Sprintf("screenshots/%s/%s/%s.%s", item.Kind, item.Id, themeName, extension)
+	filePath := fmt.Sprintf("screenshots/%s/%s/%s.%s", kind, id, themeName, extension)
 
 	// Upload to filestore
 	filestoreSvcClient := s.ClientMgr.GetFileStoreSvcClient()
@@ -152,12 +231,7 @@ func (s *ScreenShotIndexer) renderScreenshot(themeName string, item *ScreenShotI
 	})
 	if err != nil {
 		log.Printf("Failed to upload screenshot to filestore: %v", err)
-		return err
+		return nil, err
 	}
-
-	// Store the file in ThemeFiles map
-	item.ThemeFiles[themeName] = resp.File
-
-	log.Printf("Successfully uploaded screenshot: %s", filePath)
-	return nil
+	return resp.File, nil
 }
@@ -0,0 +1,180 @@
+//go:build !wasm
+// +build !wasm
+
+package services
+
+import (
+	"context"
+	"fmt"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	v1 "github.com/turnforge/lilbattle/gen/go/lilbattle/v1/models"
+	v1s "github.com/turnforge/lilbattle/gen/go/lilbattle/v1/services"
+	"github.com/turnforge/lilbattle/lib"
+	"github.com/turnforge/lilbattle/web/assets/themes"
+	"google.golang.org/grpc"
+)
+
+// fakeRenderer lets tests control render outcomes per theme
+type fakeRenderer struct {
+	render func() ([]byte, string, error)
+}
+
+func (f *fakeRenderer) Render(tiles map[string]*v1.Tile, units map[string]*v1.Unit, options *lib.RenderOptions) ([]byte, string, error) {
+	return f.render()
+}
+
+// fakeFileStoreClient lets tests control upload outcomes
+type fakeFileStoreClient struct {
+	putFile func(in *v1.PutFileRequest) (*v1.PutFileResponse, error)
+}
+
+var _ v1s.FileStoreServiceClient = (*fakeFileStoreClient)(nil)
+
+func (f *fakeFileStoreClient) PutFile(ctx context.Context, in *v1.PutFileRequest, opts ...grpc.CallOption) (*v1.PutFileResponse, error) {
+	return f.putFile(in)
+}
+
+func (f *fakeFileStoreClient) GetFile(ctx context.Context, in *v1.GetFileRequest, opts ...grpc.CallOption) (*v1.GetFileResponse, error) {
+	return nil, nil
+}
+
+func (f *fakeFileStoreClient) DeleteFile(ctx context.Context, in *v1.DeleteFileRequest, opts ...grpc.CallOption) (*v1.DeleteFileResponse, error) {
+	return nil, nil
+}
+
+func (f *fakeFileStoreClient) ListFiles(ctx context.Context, in *v1.ListFilesRequest, opts ...grpc.CallOption) (*v1.ListFilesResponse, error) {
+	return nil, nil
+}
+
+// newTestIndexer builds an indexer with injected renderers and filestore,
+// without starting the background reducer loop
+func newTestIndexer(renderers map[string]themes.WorldRenderer, filestore v1s.FileStoreServiceClient) *ScreenShotIndexer {
+	return &ScreenShotIndexer{
+		ClientMgr:        &ClientMgr{svcAddr: "test", filestoreSvcClient: filestore},
+		renderers:        renderers,
+		renderedVersions: map[string]int64{},
+	}
+}
+
+func newTestItem(id string, version int64) ScreenShotItem {
+	return ScreenShotItem{
+		Kind:        "world",
+		Id:          id,
+		Version:     version,
+		WorldData:   &v1.WorldData{},
+		ThemeErrors: map[string]error{},
+		ThemeFiles:  map[string]*v1.File{},
+	}
+}
+
+func okRenderer() themes.WorldRenderer {
+	return &fakeRenderer{render: func() ([]byte, string, error) {
+		return []byte("img"), "image/png", nil
+	}}
+}
+
+// A render failure on one theme must not race with an in-flight upload from
+// an earlier theme writing the same item's maps (run with -race)
+func TestStartBatchProcessingRenderFailureDuringUpload(t *testing.T) {
+	uploadStarted := make(chan struct{})
+	uploadRelease := make(chan struct{})
+
+	filestore := &fakeFileStoreClient{putFile: func(in *v1.PutFileRequest) (*v1.PutFileResponse, error) {
+		close(uploadStarted)
+		<-uploadRelease
+		return nil, fmt.Errorf("upload failed")
+	}}
+
+	// "default" renders fine but its upload stalls; "modern" fails to render
+	// only once that upload is in flight, forcing the writes to overlap
+	renderers := map[string]themes.WorldRenderer{
+		"default": okRenderer(),
+		"modern": &fakeRenderer{render: func() ([]byte, string, error) {
+			<-uploadStarted
+			return nil, fmt.Errorf("render failed")
+		}},
+		"fantasy": okRenderer(),
+	}
+
+	s := newTestIndexer(renderers, filestore)
+	var results []ScreenShotItem
+	s.OnComplete = func(items []ScreenShotItem) error {
+		results = items
+		return nil
+	}
+
+	go func() {
+		<-uploadStarted
+		time.Sleep(10 * time.Millisecond)
+		close(uploadRelease)
+	}()
+
+	item := newTestItem("w1", 1)
+	s.startBatchProcessing(map[string]ScreenShotItem{item.Id: item})
+
+	if len(results) != 1 {
+		t.Fatalf("expected 1 result, got %d", len(results))
+	}
+	got := results[0]
+	if got.ThemeErrors["default"] == nil {
+		t.Errorf("expected upload error for default theme")
+	}
+	if got.ThemeErrors["modern"] == nil {
+		t.Errorf("expected render error for modern theme")
+	}
+	if _, ok := got.ThemeErrors["fantasy"]; ok {
+		t.Errorf("fantasy theme should not have been attempted after modern failed")
+	}
+	if len(s.renderedVersions) != 0 {
+		t.Errorf("failed item should not be marked as rendered")
+	}
+}
+
+func TestStartBatchProcessingSkipsUnchangedVersions(t *testing.T) {
+	var uploads atomic.Int32 // uploads for one item run concurrently
+	filestore := &fakeFileStoreClient{putFile: func(in *v1.PutFileRequest) (*v1.PutFileResponse, error) {
+		uploads.Add(1)
+		return &v1.PutFileResponse{File: in.File}, nil
+	}}
+	renderers := map[string]themes.WorldRenderer{
+		"default": okRenderer(),
+		"modern":  okRenderer(),
+		"fantasy": okRenderer(),
+	}
+
+	s := newTestIndexer(renderers, filestore)
+	var results []ScreenShotItem
+	s.OnComplete = func(items []ScreenShotItem) error {
+		results = items
+		return nil
+	}
+
+	item := newTestItem("w1", 1)
+	s.startBatchProcessing(map[string]ScreenShotItem{item.Id: item})
+
+	if len(results) != 1 {
+		t.Fatalf("expected 1 result, got %d", len(results))
+	}
+	if len(results[0].ThemeFiles) != 3 {
+		t.Errorf("expected 3 theme files, got %d", len(results[0].ThemeFiles))
+	}
+	if uploads.Load() != 3 {
+		t.Errorf("expected 3 uploads, got %d", uploads.Load())
+	}
+
+	// Re-sending the same version should skip the render+upload pass entirely
+	results = nil
+	s.startBatchProcessing(map[string]ScreenShotItem{item.Id: newTestItem("w1", 1)})
+	if len(results) != 0 || uploads.Load() != 3 {
+		t.Errorf("unchanged version should be skipped, got %d results and %d uploads", len(results), uploads.Load())
+	}
+
+	// A new version renders again
+	s.startBatchProcessing(map[string]ScreenShotItem{item.Id: newTestItem("w1", 2)})
+	if uploads.Load() != 6 {
+		t.Errorf("expected new version to re-upload, got %d uploads", uploads.Load())
+	}
+}
@@ -28,16 +28,21 @@ var defaultPlayerColors = map[int32]*v1.PlayerColor{
 	12: {Primary: "#c084fc", Secondary: "#9333ea", Name: "Purple"},
 }
 
-// NewBaseTheme creates a new BaseTheme from a pre-loaded manifest
-// cityTerrains is a map of terrain IDs that use player colors (from RulesEngine.TerrainTypes)
-func NewBaseTheme(manifest *v1.ThemeManifest, cityTerrains map[int32]bool) *BaseTheme {
-	// Populate default player colors if not specified in manifest
+// populateDefaultPlayerColors fills in the default palette when the manifest
+// does not specify playerColors
+func populateDefaultPlayerColors(manifest *v1.ThemeManifest) {
 	if len(manifest.PlayerColors) == 0 {
-		manifest.PlayerColors = make(map[int32]*v1.PlayerColor)
+		manifest.PlayerColors = make(map[int32]*v1.PlayerColor, len(defaultPlayerColors))
 		for k, v := range defaultPlayerColors {
 			manifest.PlayerColors[k] = v
 		}
 	}
+}
+
+// NewBaseTheme creates a new BaseTheme from a pre-loaded manifest
+// cityTerrains is a map of terrain IDs that use player colors (from RulesEngine.TerrainTypes)
+func NewBaseTheme(manifest *v1.ThemeManifest, cityTerrains map[int32]bool) *BaseTheme {
+	populateDefaultPlayerColors(manifest)
 	return &BaseTheme{
 		manifest:     manifest,
 		cityTerrains: cityTerrains,
@@ -3,6 +3,7 @@ package themes
 import (
 	_ "embed"
 	"fmt"
+	"sync"
 
 	v1 "github.com/turnforge/lilbattle/gen/go/lilbattle/v1/models"
 	"google.golang.org/protobuf/encoding/protojson"
@@ -11,22 +12,34 @@ import (
 //go:embed default/mapping.json
 var defaultMappingJSON []byte
 
+// The embedded mapping never changes, so parse it once and share the manifest
+// across all DefaultTheme instances instead of re-parsing per construction
+var (
+	defaultManifestOnce sync.Once
+	defaultManifest     *v1.ThemeManifest
+)
+
 // DefaultTheme implements the Theme interface for PNG-based default assets
 // Extends BaseTheme with PNG-specific asset path methods
 type DefaultTheme struct {
 	*BaseTheme
 }
 
-// NewDefaultTheme creates a new default theme instance by parsing embedded mapping.json
+// NewDefaultTheme creates a new default theme instance from the embedded mapping.json
 // cityTerrains is a map of terrain IDs that use player colors (from RulesEngine.TerrainTypes)
 func NewDefaultTheme(cityTerrains map[int32]bool) *DefaultTheme {
-	manifest := &v1.ThemeManifest{}
-	if err := protojson.Unmarshal(defaultMappingJSON, manifest); err != nil {
-		panic(fmt.Sprintf("failed to parse embedded default theme mapping: %v", err))
-	}
+	defaultManifestOnce.Do(func() {
+		manifest := &v1.ThemeManifest{}
+		if err := protojson.Unmarshal(defaultMappingJSON, manifest); err != nil {
+			panic(fmt.Sprintf("failed to parse embedded default theme mapping: %v", err))
+		}
+		// Populate defaults here so the shared manifest is not mutated later
+		populateDefaultPlayerColors(manifest)
+		defaultManifest = manifest
+	})
 
 	return &DefaultTheme{
-		BaseTheme: NewBaseTheme(manifest, cityTerrains),
+		BaseTheme: NewBaseTheme(defaultManifest, cityTerrains),
 	}
 }
 
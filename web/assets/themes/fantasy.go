@@ -2,11 +2,20 @@ package themes
 
 import (
 	"fmt"
+	"sync"
 
 	v1 "github.com/turnforge/lilbattle/gen/go/lilbattle/v1/models"
 	"github.com/turnforge/lilbattle/web/assets"
 )
 
+// The embedded mapping never changes, so parse it once and share the manifest
+// across all FantasyTheme instances instead of re-parsing per construction
+var (
+	fantasyManifestOnce sync.Once
+	fantasyManifest     *v1.ThemeManifest
+	fantasyManifestErr  error
+)
+
 // FantasyTheme implements the Theme interface for the Medieval Fantasy theme
 // Mirrors fantasy.ts and extends BaseTheme
 type FantasyTheme struct {
@@ -16,24 +25,33 @@ type FantasyTheme struct {
 // NewFantasyTheme creates a new Fantasy theme instance
 // Loads the mapping.json from embedded files
 func NewFantasyTheme(cityTerrains map[int32]bool) (*FantasyTheme, error) {
-	manifest, err := assets.LoadThemeManifest("fantasy")
-	if err != nil {
-		return nil, fmt.Errorf("failed to load fantasy theme: %w", err)
-	}
+	fantasyManifestOnce.Do(func() {
+		manifest, err := assets.LoadThemeManifest("fantasy")
+		if err != nil {
+			fantasyManifestErr = fmt.Errorf("failed to load fantasy theme: %w", err)
+			return
+		}
 
-	// Ensure themeInfo is populated (if not in mapping.json, set defaults)
-	if manifest.ThemeInfo == nil {
-		manifest.ThemeInfo = &v1.ThemeInfo{
-			Name:                "Medieval Fantasy",
-			Version:             "1.0.0",
-			BasePath:            "/static/assets/themes/fantasy",
-			AssetType:           "svg",
-			NeedsPostProcessing: true,
+		// Ensure themeInfo is populated (if not in mapping.json, set defaults)
+		if manifest.ThemeInfo == nil {
+			manifest.ThemeInfo = &v1.ThemeInfo{
+				Name:                "Medieval Fantasy",
+				Version:             "1.0.0",
+				BasePath:            "/static/assets/themes/fantasy",
+				AssetType:           "svg",
+				NeedsPostProcessing: true,
+			}
 		}
+		// Populate defaults here so the shared manifest is not mutated later
+		populateDefaultPlayerColors(manifest)
+		fantasyManifest = manifest
+	})
+	if fantasyManifestErr != nil {
+		return nil, fantasyManifestErr
 	}
 
 	return &FantasyTheme{
-		BaseTheme: NewBaseTheme(manifest, cityTerrains),
+		BaseTheme: NewBaseTheme(fantasyManifest, cityTerrains),
 	}, nil
 }
 
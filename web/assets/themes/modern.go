@@ -2,11 +2,20 @@ package themes
 
 import (
 	"fmt"
+	"sync"
 
 	v1 "github.com/turnforge/lilbattle/gen/go/lilbattle/v1/models"
 	"github.com/turnforge/lilbattle/web/assets"
 )
 
+// The embedded mapping never changes, so parse it once and share the manifest
+// across all ModernTheme instances instead of re-parsing per construction
+var (
+	modernManifestOnce sync.Once
+	modernManifest     *v1.ThemeManifest
+	modernManifestErr  error
+)
+
 // ModernTheme implements the Theme interface for the Modern Military theme
 // Mirrors modern.ts and extends BaseTheme
 type ModernTheme struct {
@@ -16,24 +25,33 @@ type ModernTheme struct {
 // NewModernTheme creates a new Modern theme instance
 // Loads the mapping.json from embedded files
 func NewModernTheme(cityTerrains map[int32]bool) (*ModernTheme, error) {
-	manifest, err := assets.LoadThemeManifest("modern")
-	if err != nil {
-		return nil, fmt.Errorf("failed to load modern theme: %w", err)
-	}
+	modernManifestOnce.Do(func() {
+		manifest, err := assets.LoadThemeManifest("modern")
+		if err != nil {
+			modernManifestErr = fmt.Errorf("failed to load modern theme: %w", err)
+			return
+		}
 
-	// Ensure themeInfo is populated (if not in mapping.json, set defaults)
-	if manifest.ThemeInfo == nil {
-		manifest.ThemeInfo = &v1.ThemeInfo{
-			Name:                "Modern Military",
-			Version:             "1.0.0",
-			BasePath:            "/static/assets/themes/modern",
-			AssetType:           "svg",
-			NeedsPostProcessing: true,
+		// Ensure themeInfo is populated (if not in mapping.json, set defaults)
+		if manifest.ThemeInfo == nil {
+			manifest.ThemeInfo = &v1.ThemeInfo{
+				Name:                "Modern Military",
+				Version:             "1.0.0",
+				BasePath:            "/static/assets/themes/modern",
+				AssetType:           "svg",
+				NeedsPostProcessing: true,
+			}
 		}
+		// Populate defaults here so the shared manifest is not mutated later
+		populateDefaultPlayerColors(manifest)
+		modernManifest = manifest
+	})
+	if modernManifestErr != nil {
+		return nil, modernManifestErr
 	}
 
 	return &ModernTheme{
-		BaseTheme: NewBaseTheme(manifest, cityTerrains),
+		BaseTheme: NewBaseTheme(modernManifest, cityTerrains),
 	}, nil
 }
 
@@ -23,9 +23,13 @@ type PNGWorldRenderer struct {
 	theme *DefaultTheme
 
 	// Cache for loaded images
-	tileCache  map[string]image.Image
-	unitCache  map[string]image.Image
-	cacheMutex sync.RWMutex
+	tileCache map[string]image.Image
+	unitCache map[string]image.Image
+	// Cache for scaled variants, keyed by source cache key + target size.
+	// Distinct source images number in the dozens while cells number in the
+	// hundreds, so each unique scale is computed once instead of per cell
+	scaledCache map[string]image.Image
+	cacheMutex  sync.RWMutex
 }
 
 // NewPNGWorldRenderer creates a new PNG-based world renderer
@@ -36,9 +40,10 @@ func NewPNGWorldRenderer(theme Theme) (*PNGWorldRenderer, error) {
 	}
 
 	return &PNGWorldRenderer{
-		theme:     defaultTheme,
-		tileCache: make(map[string]image.Image),
-		unitCache: make(map[string]image.Image),
+		theme:       defaultTheme,
+		tileCache:   make(map[string]image.Image),
+		unitCache:   make(map[string]image.Image),
+		scaledCache: make(map[string]image.Image),
 	}, nil
 }
 
@@ -58,32 +63,49 @@ func (r *PNGWorldRenderer) Render(tiles map[string]*v1.Tile, units map[string]*v
 	// Create the output image
 	outputImg := image.NewRGBA(image.Rect(0, 0, width, height))
 
-	// Render tiles first (background layer)
+	// Compute each entity's pixel position once; the label passes below reuse
+	// the same positions instead of redoing the hex-to-pixel math per pass
+	tileList := make([]*v1.Tile, 0, len(tiles))
+	tilePos := make([]image.Point, 0, len(tiles))
 	for _, tile := range tiles {
-		if err := r.renderTile(outputImg, tile, minX, minY, options); err != nil {
+		x, y := lib.HexToPixelInt32(tile.Q, tile.R, options)
+		tileList = append(tileList, tile)
+		tilePos = append(tilePos, image.Point{X: x - minX, Y: y - minY})
+	}
+	unitList := make([]*v1.Unit, 0, len(units))
+	unitPos := make([]image.Point, 0, len(units))
+	for _, unit := range units {
+		x, y := lib.HexToPixelInt32(unit.Q, unit.R, options)
+		unitList = append(unitList, unit)
+		unitPos = append(unitPos, image.Point{X: x - minX, Y: y - minY})
+	}
+
+	// Render tiles first (background layer)
+	for i, tile := range tileList {
+		if err := r.renderTile(outputImg, tile, tilePos[i], options); err != nil {
 			// Log but continue - don't fail entire render for one missing tile
 			fmt.Printf("Warning: failed to render tile at (%d,%d): %v\n", tile.Q, tile.R, err)
 		}
 	}
 
 	// Render units on top
-	for _, unit := range units {
-		if err := r.renderUnit(outputImg, unit, minX, minY, options); err != nil {
+	for i, unit := range unitList {
+		if err := r.renderUnit(outputImg, unit, unitPos[i], options); err != nil {
 			fmt.Printf("Warning: failed to render unit at (%d,%d): %v\n", unit.Q, unit.R, err)
 		}
 	}
 
 	// Render tile labels if enabled (below tiles, above units)
 	if options.ShowTileLabels {
-		for _, tile := range tiles {
-			r.renderTileLabel(outputImg, tile, minX, minY, options)
+		for i, tile := range tileList {
+			r.renderTileLabel(outputImg, tile, tilePos[i], options)
 		}
 	}
 
 	// Render unit labels if enabled (on top of everything)
 	if options.ShowUnitLabels {
-		for _, unit := range units {
-			r.renderUnitLabel(outputImg, unit, minX, minY, options)
+		for i, unit := range unitList {
+			r.renderUnitLabel(outputImg, unit, unitPos[i], options)
 		}
 	}
 
@@ -97,41 +119,33 @@ func (r *PNGWorldRenderer) Render(tiles map[string]*v1.Tile, units map[string]*v
 }
 
 // renderTile draws a single tile onto the output image
-func (r *PNGWorldRenderer) renderTile(output *image.RGBA, tile *v1.Tile, offsetX, offsetY int, options *lib.RenderOptions) error {
-	// Get tile image
-	tileImg, err := r.getTileImage(tile.TileType, tile.Player)
+func (r *PNGWorldRenderer) renderTile(output *image.RGBA, tile *v1.Tile, pos image.Point, options *lib.RenderOptions) error {
+	// Get tile image, pre-scaled to the tile size
+	tileImg, cacheKey, err := r.getTileImage(tile.TileType, tile.Player)
 	if err != nil {
 		return err
 	}
+	tileImg = r.scaledFor(cacheKey, tileImg, options.TileWidth, options.TileHeight)
 
-	// Calculate position (adjusted for offset)
-	x, y := lib.HexToPixelInt32(tile.Q, tile.R, options)
-	x -= offsetX
-	y -= offsetY
-
-	// Draw tile at position (x,y is top-left)
-	r.drawImageAt(output, tileImg, x, y, options.TileWidth, options.TileHeight)
+	// Draw tile at position (pos is top-left)
+	r.drawImageAt(output, tileImg, pos.X, pos.Y, options.TileWidth, options.TileHeight)
 	return nil
 }
 
 // renderUnit draws a single unit onto the output image
-func (r *PNGWorldRenderer) renderUnit(output *image.RGBA, unit *v1.Unit, offsetX, offsetY int, options *lib.RenderOptions) error {
+func (r *PNGWorldRenderer) renderUnit(output *image.RGBA, unit *v1.Unit, pos image.Point, options *lib.RenderOptions) error {
 	// Get unit image
-	unitImg, err := r.getUnitImage(unit.UnitType, unit.Player)
+	unitImg, cacheKey, err := r.getUnitImage(unit.UnitType, unit.Player)
 	if err != nil {
 		return err
 	}
 
-	// Calculate position (adjusted for offset)
-	x, y := lib.HexToPixelInt32(unit.Q, unit.R, options)
-	x -= offsetX
-	y -= offsetY
-
 	// Draw unit slightly smaller than tile (90% size) and centered within the tile
 	unitWidth := int(float64(options.TileWidth) * 0.9)
 	unitHeight := int(float64(options.TileHeight) * 0.9)
-	unitX := x + (options.TileWidth-unitWidth)/2
-	unitY := y + (options.TileHeight-unitHeight)/2
+	unitImg = r.scaledFor(cacheKey, unitImg, unitWidth, unitHeight)
+	unitX := pos.X + (options.TileWidth-unitWidth)/2
+	unitY := pos.Y + (options.TileHeight-unitHeight)/2
 	r.drawImageAt(output, unitImg, unitX, unitY, unitWidth, unitHeight)
 	return nil
 }
@@ -148,35 +162,106 @@ func (r *PNGWorldRenderer) drawImageAt(output *image.RGBA, src image.Image, x, y
 		draw.Draw(output, dstRect, src, srcBounds.Min, draw.Over)
 	} else {
 		// Scale the image first, then draw with alpha blending
-		// Create a temporary scaled image
-		scaled := image.NewRGBA(image.Rect(0, 0, width, height))
+		scaled := scaleImage(src, width, height)
+		draw.Draw(output, dstRect, scaled, image.Point{}, draw.Over)
+	}
+}
 
-		scaleX := float64(srcBounds.Dx()) / float64(width)
-		scaleY := float64(srcBounds.Dy()) / float64(height)
+// scaleImage scales src to (width, height) with nearest-neighbor sampling
+func scaleImage(src image.Image, width, height int) *image.RGBA {
+	srcBounds := src.Bounds()
+	scaled := image.NewRGBA(image.Rect(0, 0, width, height))
+
+	srcW, srcH := srcBounds.Dx(), srcBounds.Dy()
+	scaleX := float64(srcW) / float64(width)
+	scaleY := float64(srcH) / float64(height)
+
+	// The destination-to-source column mapping is identical for every row, so
+	// compute it once instead of redoing the float multiply per pixel. Clamp
+	// here (rounding can land exactly on srcW at the edge) so the per-pixel
+	// loops below need no bounds branch
+	srcXs := make([]int, width)
+	for dx := range width {
+		srcX := int(float64(dx) * scaleX)
+		if srcX >= srcW {
+			srcX = srcW - 1
+		}
+		srcXs[dx] = srcX
+	}
 
+	// Fast path: loadPNG canonicalizes sources to *image.RGBA, so pixels can
+	// be copied 4 bytes at a time instead of boxing each one through the
+	// color.Color interface on both the read and the write
+	if rgba, ok := src.(*image.RGBA); ok {
 		for dy := range height {
-			for dx := range width {
-				srcX := int(float64(dx) * scaleX)
-				srcY := int(float64(dy) * scaleY)
-				if srcX < srcBounds.Dx() && srcY < srcBounds.Dy() {
-					c := src.At(srcBounds.Min.X+srcX, srcBounds.Min.Y+srcY)
-					scaled.Set(dx, dy, c)
+			srcY := int(float64(dy) * scaleY)
+			if srcY >= srcH {
+				continue
+			}
+			srcRow := rgba.Pix[rgba.PixOffset(srcBounds.Min.X, srcBounds.Min.Y+srcY):]
+			dstRow := scaled.Pix[dy*scaled.Stride:]
+			for dx, srcX := range srcXs {
+				si := srcX * 4
+				if srcRow[si+3] == 0 {
+					continue
 				}
+				copy(dstRow[dx*4:dx*4+4], srcRow[si:si+4])
 			}
 		}
+		return scaled
+	}
 
-		// Now draw the scaled image with proper alpha blending
-		draw.Draw(output, dstRect, scaled, image.Point{}, draw.Over)
+	for dy := range height {
+		srcY := int(float64(dy) * scaleY)
+		if srcY >= srcH {
+			continue
+		}
+		for dx, srcX := range srcXs {
+			c := src.At(srcBounds.Min.X+srcX, srcBounds.Min.Y+srcY)
+			// Unit sprites are mostly transparent margin; the output is
+			// already zeroed so fully transparent pixels need no store
+			if _, _, _, a := c.RGBA(); a == 0 {
+				continue
+			}
+			scaled.Set(dx, dy, c)
+		}
 	}
+	return scaled
 }
 
-// getTileImage loads and caches a tile image
-func (r *PNGWorldRenderer) getTileImage(tileType, playerId int32) (image.Image, error) {
+// scaledFor returns src scaled to (width, height), caching the result under
+// the source's cache key so each unique image is scaled once per size
+func (r *PNGWorldRenderer) scaledFor(cacheKey string, src image.Image, width, height int) image.Image {
+	srcBounds := src.Bounds()
+	if srcBounds.Dx() == width && srcBounds.Dy() == height {
+		return src
+	}
+
+	key := fmt.Sprintf("%s|%dx%d", cacheKey, width, height)
+
+	r.cacheMutex.RLock()
+	if img, ok := r.scaledCache[key]; ok {
+		r.cacheMutex.RUnlock()
+		return img
+	}
+	r.cacheMutex.RUnlock()
+
+	scaled := scaleImage(src, width, height)
+
+	r.cacheMutex.Lock()
+	r.scaledCache[key] = scaled
+	r.cacheMutex.Unlock()
+
+	return scaled
+}
+
+// getTileImage loads and caches a tile image, returning the image and its cache key
+func (r *PNGWorldRenderer) getTileImage(tileType, playerId int32) (image.Image, string, error) {
 	// Get path from theme - theme handles player color logic internally
 	// Theme returns "/static/assets/themes/default/Tiles/1/0.png"
 	webPath := r.theme.GetTileAssetPath(tileType, playerId)
 	if webPath == "" {
-		return nil, fmt.Errorf("tile %d not found in theme", tileType)
+		return nil, "", fmt.Errorf("tile %d not found in theme", tileType)
 	}
 
 	// Use web path as cache key (already includes effective player)
@@ -186,7 +271,7 @@ func (r *PNGWorldRenderer) getTileImage(tileType, playerId int32) (image.Image,
 	r.cacheMutex.RLock()
 	if img, ok := r.tileCache[cacheKey]; ok {
 		r.cacheMutex.RUnlock()
-		return img, nil
+		return img, cacheKey, nil
 	}
 	r.cacheMutex.RUnlock()
 
@@ -195,7 +280,7 @@ func (r *PNGWorldRenderer) getTileImage(tileType, playerId int32) (image.Image,
 
 	img, err := r.loadPNG(path)
 	if err != nil {
-		return nil, fmt.Errorf("failed to load tile %d for player %d from %s: %w", tileType, playerId, path, err)
+		return nil, "", fmt.Errorf("failed to load tile %d for player %d from %s: %w", tileType, playerId, path, err)
 	}
 
 	// Cache it
@@ -203,18 +288,18 @@ func (r *PNGWorldRenderer) getTileImage(tileType, playerId int32) (image.Image,
 	r.tileCache[cacheKey] = img
 	r.cacheMutex.Unlock()
 
-	return img, nil
+	return img, cacheKey, nil
 }
 
-// getUnitImage loads and caches a unit image
-func (r *PNGWorldRenderer) getUnitImage(unitType, playerId int32) (image.Image, error) {
+// getUnitImage loads and caches a unit image, returning the image and its cache key
+func (r *PNGWorldRenderer) getUnitImage(unitType, playerId int32) (image.Image, string, error) {
 	cacheKey := fmt.Sprintf("unit_%d_%d", unitType, playerId)
 
 	// Check cache first
 	r.cacheMutex.RLock()
 	if img, ok := r.unitCache[cacheKey]; ok {
 		r.cacheMutex.RUnlock()
-		return img, nil
+		return img, cacheKey, nil
 	}
 	r.cacheMutex.RUnlock()
 
@@ -223,14 +308,14 @@ func (r *PNGWorldRenderer) getUnitImage(unitType, playerId int32) (image.Image,
 	// We need "web/static/assets/themes/default/Units/1/0.png"
 	webPath := r.theme.GetUnitAssetPath(unitType, playerId)
 	if webPath == "" {
-		return nil, fmt.Errorf("unit %d not found in theme", unitType)
+		return nil, "", fmt.Errorf("unit %d not found in theme", unitType)
 	}
 	// Convert web path to filesystem path (remove leading "/" and prepend "web")
 	path := "web" + webPath
 
 	img, err := r.loadPNG(path)
 	if err != nil {
-		return nil, fmt.Errorf("failed to load unit %d for player %d from %s: %w", unitType, playerId, path, err)
+		return nil, "", fmt.Errorf("failed to load unit %d for player %d from %s: %w", unitType, playerId, path, err)
 	}
 
 	// Cache it
@@ -238,22 +323,33 @@ func (r *PNGWorldRenderer) getUnitImage(unitType, playerId int32) (image.Image,
 	r.unitCache[cacheKey] = img
 	r.cacheMutex.Unlock()
 
-	return img, nil
+	return img, cacheKey, nil
 }
 
 // loadPNG loads a PNG file from the filesystem
 func (r *PNGWorldRenderer) loadPNG(path string) (image.Image, error) {
-	file, err := os.Open(path)
+	// Read the whole file up front and decode from memory - the PNG decoder
+	// otherwise issues many small reads against the file handle
+	data, err := os.ReadFile(path)
 	if err != nil {
 		return nil, err
 	}
-	defer file.Close()
 
-	img, err := png.Decode(file)
+	img, err := png.Decode(bytes.NewReader(data))
 	if err != nil {
 		return nil, fmt.Errorf("failed to decode PNG: %w", err)
 	}
 
+	// Decoded PNGs are typically NRGBA or paletted; convert to premultiplied
+	// RGBA once at load time so every subsequent draw takes draw.Draw's fast
+	// integer path instead of converting each pixel on each render
+	if _, ok := img.(*image.RGBA); !ok {
+		bounds := img.Bounds()
+		rgba := image.NewRGBA(bounds)
+		draw.Draw(rgba, bounds, img, bounds.Min, draw.Src)
+		img = rgba
+	}
+
 	return img, nil
 }
 
@@ -263,14 +359,12 @@ func (r *PNGWorldRenderer) ClearCache() {
 	defer r.cacheMutex.Unlock()
 	r.tileCache = make(map[string]image.Image)
 	r.unitCache = make(map[string]image.Image)
+	r.scaledCache = make(map[string]image.Image)
 }
 
 // renderUnitLabel draws a label below the unit showing "Shortcut:MP/Health"
-func (r *PNGWorldRenderer) renderUnitLabel(output *image.RGBA, unit *v1.Unit, offsetX, offsetY int, options *lib.RenderOptions) {
-	// Calculate position (adjusted for offset)
-	x, y := lib.HexToPixelInt32(unit.Q, unit.R, options)
-	x -= offsetX
-	y -= offsetY
+func (r *PNGWorldRenderer) renderUnitLabel(output *image.RGBA, unit *v1.Unit, pos image.Point, options *lib.RenderOptions) {
+	x, y := pos.X, pos.Y
 
 	// Format label: "Shortcut:MP/Health" or "MP/Health" if no shortcut
 	health := unit.AvailableHealth
@@ -315,16 +409,13 @@ func (r *PNGWorldRenderer) renderUnitLabel(output *image.RGBA, unit *v1.Unit, of
 }
 
 // renderTileLabel draws a label at the top of the tile showing tile shortcut
-func (r *PNGWorldRenderer) renderTileLabel(output *image.RGBA, tile *v1.Tile, offsetX, offsetY int, options *lib.RenderOptions) {
+func (r *PNGWorldRenderer) renderTileLabel(output *image.RGBA, tile *v1.Tile, pos image.Point, options *lib.RenderOptions) {
 	// Only render if tile has a shortcut
 	if tile.Shortcut == "" {
 		return
 	}
 
-	// Calculate position (adjusted for offset)
-	x, y := lib.HexToPixelInt32(tile.Q, tile.R, options)
-	x -= offsetX
-	y -= offsetY
+	x, y := pos.X, pos.Y
 
 	labelText := tile.Shortcut
 
@@ -27,6 +27,18 @@ type SVGWorldRenderer struct {
 	cacheMutex sync.RWMutex
 }
 
+// Patterns used when processing loaded SVG assets, compiled once instead of
+// per call
+var (
+	// Match the linearGradient with id="playerColor" and replace stop colors
+	playerColorPrimaryPattern   = regexp.MustCompile(`(<linearGradient[^>]*id="playerColor"[^>]*>[\s\S]*?<stop[^>]*offset="0%"[^>]*stop-color=")#[0-9a-fA-F]{6}(")`)
+	playerColorSecondaryPattern = regexp.MustCompile(`(<linearGradient[^>]*id="playerColor"[^>]*>[\s\S]*?<stop[^>]*offset="100%"[^>]*stop-color=")#[0-9a-fA-F]{6}(")`)
+
+	xmlDeclPattern  = regexp.MustCompile(`<\?xml[^?]*\?>`)
+	svgStartPattern = regexp.MustCompile(`<svg[^>]*>`)
+	svgEndPattern   = regexp.MustCompile(`</svg>`)
+)
+
 // NewSVGWorldRenderer creates a new SVG-based world renderer
 func NewSVGWorldRenderer(theme Theme) (*SVGWorldRenderer, error) {
 	info := theme.GetThemeInfo()
@@ -65,36 +77,76 @@ func (r *SVGWorldRenderer) Render(tiles map[string]*v1.Tile, units map[string]*v
 	// Compute bounds
 	minX, minY, width, height := computeBounds(tiles, units, options)
 
-	// Track unique symbols we need to define
+	// Track unique symbols we need to define, plus a type+player -> symbolId
+	// table so the placement passes below reuse ids computed here instead of
+	// re-deriving them per cell
 	tileSymbols := make(map[string]string) // symbolId -> SVG content
 	unitSymbols := make(map[string]string)
+	tileSymbolIds := make(map[symbolKey]string)
+	unitSymbolIds := make(map[symbolKey]string)
+
+	// First pass: collect all unique symbols. Distinct sprites load and
+	// process independently (the symbol caches are mutex-guarded), so fetch
+	// them concurrently to overlap file reads with SVG processing
+	uniqueTileKeys := make(map[symbolKey]bool)
+	for _, tile := range tiles {
+		uniqueTileKeys[symbolKey{tile.TileType, tile.Player}] = true
+	}
+	uniqueUnitKeys := make(map[symbolKey]bool)
+	for _, unit := range units {
+		uniqueUnitKeys[symbolKey{unit.UnitType, unit.Player}] = true
+	}
 
-	// Build the SVG document
+	var symbolsMutex sync.Mutex
+	var wg sync.WaitGroup
+	for key := range uniqueTileKeys {
+		wg.Add(1)
+		go func(key symbolKey) {
+			defer wg.Done()
+			symbolId, svgContent, err := r.getTileSymbol(key.entityType, key.player, options)
+			if err != nil {
+				fmt.Printf("Warning: failed to load tile symbol for type %d: %v\n", key.entityType, err)
+				return
+			}
+			symbolsMutex.Lock()
+			tileSymbolIds[key] = symbolId
+			tileSymbols[symbolId] = svgContent
+			symbolsMutex.Unlock()
+		}(key)
+	}
+	for key := range uniqueUnitKeys {
+		wg.Add(1)
+		go func(key symbolKey) {
+			defer wg.Done()
+			symbolId, svgContent, err := r.getUnitSymbol(key.entityType, key.player, options)
+			if err != nil {
+				fmt.Printf("Warning: failed to load unit symbol for type %d: %v\n", key.entityType, err)
+				return
+			}
+			symbolsMutex.Lock()
+			unitSymbolIds[key] = symbolId
+			unitSymbols[symbolId] = svgContent
+			symbolsMutex.Unlock()
+		}(key)
+	}
+	wg.Wait()
+
+	// Build the SVG document, sizing the buffer up front: symbol content
+	// dominates, plus roughly 100 bytes per <use> element and header slack
+	estimate := 1024 + 100*(len(tiles)+len(units))
+	for _, content := range tileSymbols {
+		estimate += len(content) + 128
+	}
+	for _, content := range unitSymbols {
+		estimate += len(content) + 128
+	}
 	var svg bytes.Buffer
+	svg.Grow(estimate)
 
 	// Start SVG with computed viewBox
 	svg.WriteString(fmt.Sprintf(`<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 %d %d" width="%d" height="%d">
 `, width, height, width, height))
 
-	// First pass: collect all unique symbols
-	for _, tile := range tiles {
-		symbolId, svgContent, err := r.getTileSymbol(tile.TileType, tile.Player, options)
-		if err != nil {
-			fmt.Printf("Warning: failed to load tile symbol for type %d: %v\n", tile.TileType, err)
-			continue
-		}
-		tileSymbols[symbolId] = svgContent
-	}
-
-	for _, unit := range units {
-		symbolId, svgContent, err := r.getUnitSymbol(unit.UnitType, unit.Player, options)
-		if err != nil {
-			fmt.Printf("Warning: failed to load unit symbol for type %d: %v\n", unit.UnitType, err)
-			continue
-		}
-		unitSymbols[symbolId] = svgContent
-	}
-
 	// Write defs section with all symbols
 	svg.WriteString("  <defs>\n")
 	for symbolId, content := range tileSymbols {
@@ -114,8 +166,8 @@ func (r *SVGWorldRenderer) Render(tiles map[string]*v1.Tile, units map[string]*v
 	// Second pass: place tiles using <use> elements
 	svg.WriteString("  <!-- Tiles -->\n")
 	for _, tile := range tiles {
-		symbolId := r.tileSymbolId(tile.TileType, tile.Player)
-		if _, ok := tileSymbols[symbolId]; !ok {
+		symbolId, ok := tileSymbolIds[symbolKey{tile.TileType, tile.Player}]
+		if !ok {
 			continue // Skip if symbol wasn't loaded
 		}
 
@@ -128,10 +180,16 @@ func (r *SVGWorldRenderer) Render(tiles map[string]*v1.Tile, units map[string]*v
 	}
 
 	// Third pass: place units on top
+	// Units are slightly smaller (90% of tile) and centered within the tile;
+	// the size and centering offsets are the same for every unit
+	unitWidth := int(float64(options.TileWidth) * 0.9)
+	unitHeight := int(float64(options.TileHeight) * 0.9)
+	unitOffsetX := (options.TileWidth - unitWidth) / 2
+	unitOffsetY := (options.TileHeight - unitHeight) / 2
 	svg.WriteString("\n  <!-- Units -->\n")
 	for _, unit := range units {
-		symbolId := r.unitSymbolId(unit.UnitType, unit.Player)
-		if _, ok := unitSymbols[symbolId]; !ok {
+		symbolId, ok := unitSymbolIds[symbolKey{unit.UnitType, unit.Player}]
+		if !ok {
 			continue
 		}
 
@@ -139,11 +197,8 @@ func (r *SVGWorldRenderer) Render(tiles map[string]*v1.Tile, units map[string]*v
 		x -= minX
 		y -= minY
 
-		// Units are slightly smaller (90% of tile) and centered within the tile
-		unitWidth := int(float64(options.TileWidth) * 0.9)
-		unitHeight := int(float64(options.TileHeight) * 0.9)
-		useX := x + (options.TileWidth-unitWidth)/2
-		useY := y + (options.TileHeight-unitHeight)/2
+		useX := x + unitOffsetX
+		useY := y + unitOffsetY
 
 		svg.WriteString(fmt.Sprintf("  <use href=\"#%s\" x=\"%d\" y=\"%d\" width=\"%d\" height=\"%d\"/>\n",
 			symbolId, useX, useY, unitWidth, unitHeight))
@@ -154,10 +209,10 @@ func (r *SVGWorldRenderer) Render(tiles map[string]*v1.Tile, units map[string]*v
 	return svg.Bytes(), "image/svg+xml", nil
 }
 
-// tileSymbolId generates a unique symbol ID for a tile type+player
-func (r *SVGWorldRenderer) tileSymbolId(tileType, player int32) string {
-	effectivePlayer := r.theme.GetEffectivePlayer(tileType, player)
-	return fmt.Sprintf("tile_%d_%d", tileType, effectivePlayer)
+// symbolKey identifies a unique tile or unit sprite within one render
+type symbolKey struct {
+	entityType int32
+	player     int32
 }
 
 // unitSymbolId generates a unique symbol ID for a unit type+player
@@ -168,7 +223,7 @@ func (r *SVGWorldRenderer) unitSymbolId(unitType, player int32) string {
 // getTileSymbol loads and processes a tile SVG, returning symbol ID and inner content
 func (r *SVGWorldRenderer) getTileSymbol(tileType, player int32, options *lib.RenderOptions) (string, string, error) {
 	effectivePlayer := r.theme.GetEffectivePlayer(tileType, player)
-	symbolId := r.tileSymbolId(tileType, player) // tileSymbolId also calls GetEffectivePlayer
+	symbolId := fmt.Sprintf("tile_%d_%d", tileType, effectivePlayer)
 
 	// Check cache
 	r.cacheMutex.RLock()
@@ -253,16 +308,17 @@ func (r *SVGWorldRenderer) loadAndProcessSVG(path string, player int32) (string,
 
 // applyPlayerColors replaces the playerColor gradient with player-specific colors
 func (r *SVGWorldRenderer) applyPlayerColors(svg string, colors *v1.PlayerColor) string {
-	// Match the linearGradient with id="playerColor" and replace stop colors
-	// Pattern: <linearGradient id="playerColor">...<stop ... stop-color="..."/>...<stop ... stop-color="..."/>...</linearGradient>
+	// Most nature/water tiles have no playerColor gradient at all - check with a
+	// cheap substring scan before paying for the regex replacements below
+	if !strings.Contains(svg, "playerColor") {
+		return svg
+	}
 
 	// Replace first stop color (primary)
-	primaryPattern := regexp.MustCompile(`(<linearGradient[^>]*id="playerColor"[^>]*>[\s\S]*?<stop[^>]*offset="0%"[^>]*stop-color=")#[0-9a-fA-F]{6}(")`)
-	svg = primaryPattern.ReplaceAllString(svg, "${1}"+colors.Primary+"${2}")
+	svg = playerColorPrimaryPattern.ReplaceAllString(svg, "${1}"+colors.Primary+"${2}")
 
 	// Replace second stop color (secondary)
-	secondaryPattern := regexp.MustCompile(`(<linearGradient[^>]*id="playerColor"[^>]*>[\s\S]*?<stop[^>]*offset="100%"[^>]*stop-color=")#[0-9a-fA-F]{6}(")`)
-	svg = secondaryPattern.ReplaceAllString(svg, "${1}"+colors.Secondary+"${2}")
+	svg = playerColorSecondaryPattern.ReplaceAllString(svg, "${1}"+colors.Secondary+"${2}")
 
 	return svg
 }
@@ -270,14 +326,11 @@ func (r *SVGWorldRenderer) applyPlayerColors(svg string, colors *v1.PlayerColor)
 // extractSVGContent removes the outer <svg> wrapper and returns inner content
 func (r *SVGWorldRenderer) extractSVGContent(svg string) string {
 	// Remove <?xml...?> declaration if present
-	svg = regexp.MustCompile(`<\?xml[^?]*\?>`).ReplaceAllString(svg, "")
+	svg = xmlDeclPattern.ReplaceAllString(svg, "")
 
 	// Extract content between <svg...> and </svg>
-	startPattern := regexp.MustCompile(`<svg[^>]*>`)
-	endPattern := regexp.MustCompile(`</svg>`)
-
-	startLoc := startPattern.FindStringIndex(svg)
-	endLoc := endPattern.FindStringIndex(svg)
+	startLoc := svgStartPattern.FindStringIndex(svg)
+	endLoc := svgEndPattern.FindStringIndex(svg)
 
 	if startLoc != nil && endLoc != nil && endLoc[0] > startLoc[1] {
 		return strings.TrimSpace(svg[startLoc[1]:endLoc[0]])
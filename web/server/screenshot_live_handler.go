@@ -3,12 +3,42 @@ package server
 import (
 	"log"
 	"net/http"
+	"sync"
 
 	protos "github.com/turnforge/lilbattle/gen/go/lilbattle/v1/models"
 	"github.com/turnforge/lilbattle/lib"
 	"github.com/turnforge/lilbattle/web/assets/themes"
 )
 
+// Renderers cached per theme across requests - they hold decoded-asset
+// caches, so building a fresh renderer per request would re-read and
+// re-decode every tile/unit asset for each screenshot served
+var (
+	liveRenderersMutex sync.Mutex
+	liveRenderers      = map[string]themes.WorldRenderer{}
+)
+
+// liveRendererForTheme returns the cached renderer for a theme, creating it on first use
+func liveRendererForTheme(themeName string) (themes.WorldRenderer, error) {
+	liveRenderersMutex.Lock()
+	defer liveRenderersMutex.Unlock()
+	if renderer, ok := liveRenderers[themeName]; ok {
+		return renderer, nil
+	}
+
+	re := lib.DefaultRulesEngine()
+	theme, err := themes.CreateTheme(themeName, re.GetCityTerrains())
+	if err != nil {
+		return nil, err
+	}
+	renderer, err := themes.CreateWorldRenderer(theme)
+	if err != nil {
+		return nil, err
+	}
+	liveRenderers[themeName] = renderer
+	return renderer, nil
+}
+
 // handleWorldScreenshotLive dynamically renders a world screenshot using the specified theme
 // GET /worlds/{worldId}/screenshot/live?theme=fantasy
 func (r *RootViewsHandler) handleWorldScreenshotLive(w http.ResponseWriter, req *http.Request) {
@@ -77,20 +107,12 @@ func (r *RootViewsHandler) handleGameScreenshotLive(w http.ResponseWriter, req *
 
 // renderScreenshot renders tiles and units using the specified theme
 func (r *RootViewsHandler) renderScreenshot(w http.ResponseWriter, tiles map[string]*protos.Tile, units map[string]*protos.Unit, themeName string) {
-	// Create theme
-	re := lib.DefaultRulesEngine()
-	theme, err := themes.CreateTheme(themeName, re.GetCityTerrains())
-	if err != nil {
-		log.Printf("Failed to create theme %s: %v", themeName, err)
-		http.Error(w, "Invalid theme", http.StatusBadRequest)
-		return
-	}
-
-	// Create renderer for this theme
-	renderer, err := themes.CreateWorldRenderer(theme)
+	// The theme name is the only user input here, so any creation failure
+	// means an invalid/unsupported theme
+	renderer, err := liveRendererForTheme(themeName)
 	if err != nil {
 		log.Printf("Failed to create renderer for theme %s: %v", themeName, err)
-		http.Error(w, "Failed to create renderer", http.StatusInternalServerError)
+		http.Error(w, "Invalid theme", http.StatusBadRequest)
 		return
 	}
 